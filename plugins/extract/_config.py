@@ -56,3 +56,11 @@ class Config(FaceswapConfig):
                  "This option prevents Tensorflow from allocating all of the GPU VRAM at launch "
                  "but can lead to higher VRAM fragmentation and slower performance. Should only "
                  "be enabled if you are having problems running extraction.")
+        self.add_item(
+            section=section, title="fast_preprocess", datatype=bool, default=True,
+            info="Use bilinear interpolation when resizing frames for the detector. This is "
+                 "noticeably faster than the bicubic (upscaling) and area (downscaling) "
+                 "interpolation used when this option is disabled. Detectors are generally "
+                 "tolerant of the interpolation method, but downscaling large frames with "
+                 "bilinear interpolation can very slightly reduce the number of small faces that "
+                 "are found. Disable this option to use the higher quality interpolation methods.")
@@ -14,11 +14,18 @@ To get a :class:`~lib.faces_detect.DetectedFace` object use the function:
 
 >>> face = self.to_detected_face(<face left>, <face top>, <face right>, <face bottom>)
 
+Or for an (N, 4) array of (`left`, `top`, `right`, `bottom`) bounding boxes:
+
+>>> faces = self.to_detected_faces(<bounding boxes>)
+
 """
+import os
+from concurrent import futures
+
 import cv2
 import numpy as np
 
-from lib.faces_detect import DetectedFace, rotate_landmarks
+from lib.faces_detect import DetectedFace
 from plugins.extract._base import Extractor, logger
 
 
@@ -67,9 +74,42 @@ class Detector(Extractor):
         self.min_size = min_size
 
         self._plugin_type = "detect"
+        self._fast_preprocess = self.config.get("fast_preprocess", True)
+        self._rotation_matrices = []
+        """ list: (`angle`, `rotation matrix`) tuples for each angle in :attr:`rotation`. Set in
+        :func:`initialize` once :attr:`~plugins.extract._base.Extractor.input_size` is known """
+        self._executor = None
+        """ :class:`concurrent.futures.ThreadPoolExecutor`: The worker threads that compile
+        detection images in :func:`get_batch`. Created in :func:`initialize` once the final
+        :attr:`~plugins.extract._base.Extractor.batchsize` is known and shut down in :func:`join`
+        """
 
         logger.debug("Initialized _base %s", self.__class__.__name__)
 
+    def initialize(self, *args, **kwargs):
+        """ Inititalize the detector plugin, build the rotation matrices for :attr:`rotation` and
+        create the worker threads for compiling detection images.
+
+            Should be called from :mod:`~plugins.extract.pipeline`
+        """
+        super().initialize(*args, **kwargs)
+        self._rotation_matrices = self._get_rotation_matrices()
+        # OpenCV's own functions are multi-threaded, so don't use more workers than there are CPUs
+        workers = max(1, min(self.batchsize, os.cpu_count() or 1))
+        logger.debug("Compiling detection images with %s worker threads", workers)
+        self._executor = futures.ThreadPoolExecutor(max_workers=workers,
+                                                    thread_name_prefix="detect_compile")
+
+    def join(self):
+        """ Join all threads and shut down the worker threads used for compiling detection images
+
+        Exposed for :mod:`~plugins.extract.pipeline` to join plugin's threads
+        """
+        super().join()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     # <<< QUEUE METHODS >>> #
     def get_batch(self, queue):
         """ Get items for inputting to the detector plugin in batches
@@ -77,15 +117,25 @@ class Detector(Extractor):
         Items are returned from the ``queue`` in batches of
         :attr:`~plugins.extract._base.Extractor.batchsize`
 
+        The ``scaled_image`` array is held in ``uint8`` until it is written as ``float32``. A new
+        array is created for each batch and is not used again after the plugin's
+        :func:`process_input`, so plugins may normalize it in place to create the ``feed``.
+
         Remember to put ``'EOF'`` to the out queue after processing
         the final batch
 
+        Each image is compiled in one of the plugin's worker threads as soon as it has been read,
+        so waiting on the ``queue`` for the next item overlaps with compiling the items already
+        read. Frames are loaded and decoded upstream of the ``queue`` in their own thread, so no
+        further prefetching is performed here.
+
         Outputs items in the following format. All lists are of length
         :attr:`~plugins.extract._base.Extractor.batchsize`:
 
         >>> {'filename': [<filenames of source frames>],
         >>>  'image': [<source images>],
         >>>  'scaled_image': <np.array of images standardized for prediction>,
+        >>>  'resized_image': [<source images resized for prediction, prior to padding>],
         >>>  'scale': [<scaling factors for each image>],
         >>>  'pad': [<padding for each image>],
         >>>  'detected_faces': [[<lib.faces_detect.DetectedFace objects]]}
@@ -105,19 +155,27 @@ class Detector(Extractor):
         """
         exhausted = False
         batch = dict()
-        for _ in range(self.batchsize):
+        items = []
+        compiled = []
+        scaled_images = self._get_feed_buffer(self.batchsize)
+        # OpenCV releases the GIL, so threads are sufficient for compiling images
+        for idx in range(self.batchsize):
             item = self._get_item(queue)
             if item == "EOF":
                 exhausted = True
                 break
-            for key, val in item.items():
-                batch.setdefault(key, []).append(val)
-            scaled_image, scale, pad = self._compile_detection_image(item["image"])
-            batch.setdefault("scaled_image", []).append(scaled_image)
-            batch.setdefault("scale", []).append(scale)
-            batch.setdefault("pad", []).append(pad)
-        if batch:
-            batch["scaled_image"] = np.array(batch["scaled_image"], dtype="float32")
+            items.append(item)
+            compiled.append(self._executor.submit(self._compile_detection_image,
+                                                  item["image"],
+                                                  scaled_images[idx]))
+        compiled = [future.result() for future in compiled]
+        if items:
+            for key in items[0]:
+                batch[key] = [item[key] for item in items]
+            batch["scale"] = [scale for scale, _, _ in compiled]
+            batch["pad"] = [pad for _, pad, _ in compiled]
+            batch["resized_image"] = [image for _, _, image in compiled]
+            batch["scaled_image"] = scaled_images[:len(items)]
             logger.trace("Returning batch: %s", {k: v.shape if isinstance(v, np.ndarray) else v
                                                  for k, v in batch.items() if k != "image"})
         else:
@@ -130,8 +188,8 @@ class Detector(Extractor):
 
         This should be called as the final task of each ``plugin``.
 
-        It strips unneeded items from the :attr:`batch` ``dict`` and performs standard final
-        processing on each item
+        It performs standard final processing on each item and yields a new ``dict`` holding only
+        the keys required downstream, so the rest of :attr:`batch` is never copied
 
         Outputs items in the format:
 
@@ -159,34 +217,23 @@ class Detector(Extractor):
         logger.trace("Item out: %s", {k: v.shape if isinstance(v, np.ndarray) else v
                                       for k, v in batch.items()})
 
-        batch_faces = [[self.to_detected_face(face[0], face[1], face[2], face[3])
-                        for face in faces]
-                       for faces in batch["prediction"]]
-        # Rotations
-        if any(m.any() for m in batch["rotmat"]) and any(batch_faces):
-            batch_faces = [[self._rotate_rect(face, rotmat) if rotmat.any() else face
-                            for face in faces]
-                           for faces, rotmat in zip(batch_faces, batch["rotmat"])]
-
-        # Scale back out to original frame
-        batch["detected_faces"] = [[self.to_detected_face((face.left - pad[0]) / scale,
-                                                          (face.top - pad[1]) / scale,
-                                                          (face.right - pad[0]) / scale,
-                                                          (face.bottom - pad[1]) / scale)
-                                    for face in faces]
-                                   for scale, pad, faces in zip(batch["scale"],
-                                                                batch["pad"],
-                                                                batch_faces)]
-
-        # Remove zero sized faces
-        self._remove_zero_sized_faces(batch)
-        if self.min_size > 0 and batch.get("detected_faces", None):
-            batch["detected_faces"] = self._filter_small_faces(batch["detected_faces"])
-
-        self._remove_invalid_keys(batch, ("detected_faces", "filename", "image"))
-        batch = self._dict_lists_to_list_dicts(batch)
-
-        for item in batch:
+        for prediction, rotated, rotmat, scale, pad, image, filename in zip(batch["prediction"],
+                                                                            batch["rotated_mask"],
+                                                                            batch["rotmat"],
+                                                                            batch["scale"],
+                                                                            batch["pad"],
+                                                                            batch["image"],
+                                                                            batch["filename"]):
+            boxes = self._get_boxes(prediction)
+            if rotated:
+                boxes = self._rotate_boxes(boxes, rotmat)
+            # Scale back out to original frame and remove invalid faces
+            item = dict(image=image,
+                        filename=filename,
+                        detected_faces=self._scale_and_filter_faces(boxes,
+                                                                    scale,
+                                                                    pad,
+                                                                    image.shape[:2]))
             logger.trace("final output: %s", {k: v.shape if isinstance(v, np.ndarray) else v
                                               for k, v in item.items()})
             yield item
@@ -199,22 +246,52 @@ class Detector(Extractor):
                             y=int(round(top)),
                             h=int(round(bottom - top)))
 
+    @staticmethod
+    def to_detected_faces(boxes):
+        """ Return a list of :class:`~lib.faces_detect.DetectedFace` objects for an array of
+        bounding boxes.
+
+        This is the equivalent of calling :func:`to_detected_face` for each bounding box, but the
+        points for all of the boxes are rounded in a single operation.
+
+        Parameters
+        ----------
+        boxes: numpy.ndarray
+            An (N, 4) array of (`left`, `top`, `right`, `bottom`) bounding boxes
+
+        Returns
+        -------
+        list
+            A :class:`~lib.faces_detect.DetectedFace` object for each bounding box
+        """
+        rects = Detector._boxes_to_rects(np.asarray(boxes, dtype="float64"))
+        return Detector._rects_to_detected_faces(rects.astype("int64"))
+
     # <<< PROTECTED ACCESS METHODS >>> #
     # <<< PREDICT WRAPPER >>> #
     def _predict(self, batch):
-        """ Wrap models predict function in rotations """
+        """ Wrap models predict function in rotations.
+
+        Images which already have faces are removed from the feed for subsequent rotations, so
+        that the model only predicts on the images that still need faces finding. """
         batch["rotmat"] = [np.array([]) for _ in range(len(batch["feed"]))]
+        batch["rotated_mask"] = np.zeros(len(batch["feed"]), dtype="bool")
         found_faces = [np.array([]) for _ in range(len(batch["feed"]))]
-        for angle in self.rotation:
-            # Rotate the batch and insert placeholders for already found faces
-            self._rotate_batch(batch, angle)
+        for angle, rotation_matrix in self._rotation_matrices:
+            # Rotate only the images which do not yet have faces
+            unsolved = [idx for idx, faces in enumerate(found_faces) if not faces.any()]
+            if rotation_matrix.any():
+                batch = self._rotate_batch(batch, rotation_matrix, unsolved)
             batch = self.predict(batch)
 
             if angle != 0 and any([face.any() for face in batch["prediction"]]):
                 logger.verbose("found face(s) by rotating image %s degrees", angle)
 
-            found_faces = [face if not found.any() else found
-                           for face, found in zip(batch["prediction"], found_faces)]
+            for idx, faces in zip(unsolved, batch["prediction"]):
+                if faces.any():
+                    found_faces[idx] = faces
+                    batch["rotmat"][idx] = rotation_matrix
+                    batch["rotated_mask"][idx] = angle != 0
 
             if all([face.any() for face in found_faces]):
                 logger.trace("Faces found for all images")
@@ -226,18 +303,72 @@ class Detector(Extractor):
         return batch
 
     # <<< DETECTION IMAGE COMPILATION METHODS >>> #
-    def _compile_detection_image(self, input_image):
-        """ Compile the detection image for feeding into the model"""
-        image = self._convert_color(input_image)
+    def _get_feed_buffer(self, batchsize):
+        """ Return an uninitialized ``float32`` array to hold a batch of detection images.
+
+        A new array is returned for each batch, as the previous batch may still be travelling
+        through the plugin's queues whilst the next batch is being compiled.
+        """
+        shape = (batchsize, self.input_size, self.input_size)
+        if self.colorformat != "GRAY":
+            shape += (3, )
+        return np.empty(shape, dtype="float32")
 
-        image_size = image.shape[:2]
+    def _compile_detection_image(self, input_image, feed):
+        """ Compile the detection image for feeding into the model
+
+        Parameters
+        ----------
+        input_image: numpy.ndarray
+            The source frame
+        feed: numpy.ndarray
+            The slot in the preallocated batch array that the compiled image is written into
+
+        Returns
+        -------
+        scale: float
+            The scaling factor applied to the source frame
+        pad: tuple
+            The (`left`, `top`) padding applied to the scaled frame
+        image: numpy.ndarray
+            The scaled frame, prior to padding, for compiling any rotated detection images
+        """
+        image_size = input_image.shape[:2]
         scale = self._set_scale(image_size)
         pad = self._set_padding(image_size, scale)
 
+        image = input_image
+        if self.colorformat == "GRAY":
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)  # pylint:disable=no-member
         image = self._scale_image(image, image_size, scale)
-        image = self._pad_image(image)
-        logger.trace("compiled: (images shape: %s, scale: %s, pad: %s)", image.shape, scale, pad)
-        return image, scale, pad
+        self._pad_image(image, feed)
+        logger.trace("compiled: (images shape: %s, scale: %s, pad: %s)", feed.shape, scale, pad)
+        return scale, pad, image
+
+    def _compile_rotated_image(self, image, rotation_matrix, feed):
+        """ Compile a rotated detection image for feeding into the model.
+
+        The padding and rotation are composed into a single affine transform, so the scaled
+        frame is padded and rotated in one warp, rather than rotating the padded feed.
+
+        Parameters
+        ----------
+        image: numpy.ndarray
+            The scaled frame, prior to padding, as returned from
+            :func:`_compile_detection_image`
+        rotation_matrix: numpy.ndarray
+            The matrix to rotate the square, padded image by
+        feed: numpy.ndarray
+            The slot in the preallocated batch array that the compiled image is written into
+        """
+        height, width = image.shape[:2]
+        pad = ((self.input_size - width) // 2, (self.input_size - height) // 2)
+        matrix = rotation_matrix.copy()
+        matrix[:, 2] += matrix[:, :2] @ pad
+        image = cv2.warpAffine(image,  # pylint: disable=no-member
+                               matrix,
+                               (self.input_size, self.input_size))
+        self._pad_image(image, feed)
 
     def _set_scale(self, image_size):
         """ Set the scale factor for incoming image """
@@ -251,64 +382,196 @@ class Detector(Extractor):
         pad_top = int(self.input_size - int(image_size[0] * scale)) // 2
         return pad_left, pad_top
 
-    @staticmethod
-    def _scale_image(image, image_size, scale):
-        """ Scale the image and optional pad to given size """
-        interpln = cv2.INTER_CUBIC if scale > 1.0 else cv2.INTER_AREA  # pylint:disable=no-member
+    def _scale_image(self, image, image_size, scale):
+        """ Scale the image and optional pad to given size
+
+        Bilinear interpolation is used if the ``fast_preprocess`` option is enabled, otherwise
+        bicubic interpolation is used for upscaling and area interpolation for downscaling.
+        """
+        # pylint:disable=no-member
+        if self._fast_preprocess:
+            interpln = cv2.INTER_LINEAR
+        else:
+            interpln = cv2.INTER_CUBIC if scale > 1.0 else cv2.INTER_AREA
         if scale != 1.0:
             dims = (int(image_size[1] * scale), int(image_size[0] * scale))
             logger.trace("Resizing detection image from %s to %s. Scale=%s",
                          "x".join(str(i) for i in reversed(image_size)),
                          "x".join(str(i) for i in dims), scale)
-            image = cv2.resize(image, dims, interpolation=interpln)  # pylint:disable=no-member
+            image = cv2.resize(image, dims, interpolation=interpln)
         logger.trace("Resized image shape: %s", image.shape)
         return image
 
-    def _pad_image(self, image):
-        """ Pad a resized image to input size """
+    def _pad_image(self, image, feed):
+        """ Pad a resized image to input size.
+
+        The image is cast and copied into the centre of the ``float32`` feed slot in a single
+        pass, and only the border outside of the image is zeroed. For ``RGB`` models the channels
+        are swapped within the same copy.
+        """
+        if self.colorformat == "RGB":
+            image = image[..., ::-1]
         height, width = image.shape[:2]
+        pad_l = (self.input_size - width) // 2
+        pad_t = (self.input_size - height) // 2
+        pad_r = pad_l + width
+        pad_b = pad_t + height
         if width < self.input_size or height < self.input_size:
-            pad_l = (self.input_size - width) // 2
-            pad_r = (self.input_size - width) - pad_l
-            pad_t = (self.input_size - height) // 2
-            pad_b = (self.input_size - height) - pad_t
-            image = cv2.copyMakeBorder(  # pylint:disable=no-member
-                image,
-                pad_t,
-                pad_b,
-                pad_l,
-                pad_r,
-                cv2.BORDER_CONSTANT)  # pylint:disable=no-member
-        logger.trace("Padded image shape: %s", image.shape)
-        return image
+            feed[:pad_t] = 0
+            feed[pad_b:] = 0
+            feed[pad_t:pad_b, :pad_l] = 0
+            feed[pad_t:pad_b, pad_r:] = 0
+        feed[pad_t:pad_b, pad_l:pad_r] = image
+        logger.trace("Padded image shape: %s", feed.shape)
 
     # <<< FINALIZE METHODS >>> #
     @staticmethod
-    def _remove_zero_sized_faces(batch):
-        """ Remove items from dict where detected face is of zero size
-            or face falls entirely outside of image """
-        dims = [img.shape[:2] for img in batch["image"]]
-        logger.trace("image dims: %s", dims)
-        batch["detected_faces"] = [[face for face in faces
-                                    if face.right > 0 and face.left < dim[1]
-                                    and face.bottom > 0 and face.top < dim[0]]
-                                   for dim, faces in zip(dims,
-                                                         batch.get("detected_faces", list()))]
-
-    def _filter_small_faces(self, detected_faces):
-        """ Filter out any faces smaller than the min size threshold """
-        retval = []
-        for faces in detected_faces:
-            this_image = []
-            for face in faces:
-                face_size = (face.w ** 2 + face.h ** 2) ** 0.5
-                if face_size < self.min_size:
-                    logger.debug("Removing detected face: (face_size: %s, min_size: %s",
-                                 face_size, self.min_size)
-                    continue
-                this_image.append(face)
-            retval.append(this_image)
-        return retval
+    def _get_boxes(prediction):
+        """ Obtain the bounding boxes from a plugin's prediction for a single image.
+
+        Parameters
+        ----------
+        prediction: numpy.ndarray
+            The prediction for an image. Each row should have the `left`, `top`, `right`,
+            `bottom` points of a face as its first 4 items
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 4) ``float64`` array of (`left`, `top`, `right`, `bottom`) bounding boxes
+        """
+        if not len(prediction):  # pylint:disable=len-as-condition
+            return np.empty((0, 4), dtype="float64")
+        return np.atleast_2d(prediction)[:, :4].astype("float64")
+
+    @staticmethod
+    def _rotate_boxes(boxes, rotation_matrix):
+        """ Rotate bounding boxes in a rotated feed image back to the un-rotated feed image.
+
+        The 4 corners of each box are transformed by the inverse of the rotation matrix and the
+        axis aligned bounding box of the transformed corners is returned.
+
+        Parameters
+        ----------
+        boxes: numpy.ndarray
+            An (N, 4) array of (`left`, `top`, `right`, `bottom`) bounding boxes
+        rotation_matrix: numpy.ndarray
+            The rotation matrix that the feed image was rotated by
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 4) array of the rotated (`left`, `top`, `right`, `bottom`) bounding boxes
+        """
+        logger.trace("Rotating bounding boxes")
+        matrix = cv2.invertAffineTransform(rotation_matrix)  # pylint: disable=no-member
+        corners = boxes[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+        corners = corners @ matrix[:, :2].T + matrix[:, 2]
+        return np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1)
+
+    def _scale_and_filter_faces(self, boxes, scale, pad, dims):
+        """ Scale the faces detected in a feed image back out to the original frame.
+
+        Faces that fall entirely outside of the frame, or are smaller than :attr:`min_size`
+        across the diagonal, are removed. The bounding boxes are processed as a single array by
+        :func:`_scale_and_filter_boxes`, so :class:`~lib.faces_detect.DetectedFace` objects are
+        only created for faces that are kept.
+
+        Parameters
+        ----------
+        boxes: numpy.ndarray
+            An (N, 4) ``float64`` array of (`left`, `top`, `right`, `bottom`) bounding boxes
+            found in the feed image
+        scale: float
+            The scaling factor that was applied to the original frame
+        pad: tuple
+            The (`left`, `top`) padding that was applied to the scaled frame
+        dims: tuple
+            The (`height`, `width`) of the original frame
+
+        Returns
+        -------
+        list
+            The :class:`~lib.faces_detect.DetectedFace` objects scaled to the original frame
+        """
+        if not boxes.size:
+            return []
+        rects = self._scale_and_filter_boxes(boxes, scale, pad, dims, self.min_size)
+        return self._rects_to_detected_faces(rects)
+
+    @staticmethod
+    def _scale_and_filter_boxes(boxes, scale, pad, dims, min_size):
+        """ The numeric core of :func:`_scale_and_filter_faces`.
+
+        Parameters
+        ----------
+        boxes: numpy.ndarray
+            An (N, 4) ``float64`` array of (`left`, `top`, `right`, `bottom`) bounding boxes in
+            feed image space
+        scale: float
+            The scaling factor that was applied to the original frame
+        pad: tuple
+            The (`left`, `top`) padding that was applied to the scaled frame
+        dims: tuple
+            The (`height`, `width`) of the original frame
+        min_size: int
+            Faces below this size across the diagonal are removed. ``0`` for off
+
+        Returns
+        -------
+        numpy.ndarray
+            An (M, 4) ``int64`` array of the (`x`, `y`, `w`, `h`) rounded bounding boxes to keep
+        """
+        boxes = (boxes - (pad[0], pad[1], pad[0], pad[1])) / scale
+        rects = Detector._boxes_to_rects(boxes)
+
+        left, top, width, height = rects.T
+        keep = (left + width > 0) & (left < dims[1]) & (top + height > 0) & (top < dims[0])
+        if min_size > 0:
+            face_size_sq = width ** 2 + height ** 2
+            small = keep & (face_size_sq < min_size ** 2)
+            if small.any():
+                logger.debug("Removing detected face(s): (face_sizes: %s, min_size: %s)",
+                             np.sqrt(face_size_sq[small]).tolist(), min_size)
+            keep &= ~small
+        return rects[keep].astype("int64")
+
+    @staticmethod
+    def _boxes_to_rects(boxes):
+        """ Convert bounding boxes to rounded rectangles.
+
+        Parameters
+        ----------
+        boxes: numpy.ndarray
+            An (N, 4) ``float64`` array of (`left`, `top`, `right`, `bottom`) bounding boxes
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 4) ``float64`` array of the (`x`, `y`, `w`, `h`) bounding boxes, rounded to
+            the nearest integer
+        """
+        rects = np.empty_like(boxes)
+        rects[:, :2] = boxes[:, :2]
+        np.subtract(boxes[:, 2:], boxes[:, :2], out=rects[:, 2:])
+        return np.rint(rects, out=rects)
+
+    @staticmethod
+    def _rects_to_detected_faces(rects):
+        """ Create a :class:`~lib.faces_detect.DetectedFace` object for each rounded rectangle.
+
+        Parameters
+        ----------
+        rects: numpy.ndarray
+            An (N, 4) ``int64`` array of (`x`, `y`, `w`, `h`) bounding boxes
+
+        Returns
+        -------
+        list
+            A :class:`~lib.faces_detect.DetectedFace` object for each rectangle
+        """
+        return [DetectedFace(x=pt_x, w=width, y=pt_y, h=height)
+                for pt_x, pt_y, width, height in rects.tolist()]
 
     # <<< IMAGE ROTATION METHODS >>> #
     @staticmethod
@@ -342,54 +605,55 @@ class Detector(Extractor):
         logger.debug("Rotation Angles: %s", rotation_angles)
         return rotation_angles
 
-    def _rotate_batch(self, batch, angle):
-        """ Rotate images in a batch by given angle
-            if any faces have already been detected for a batch, store the existing rotation
-            matrix and replace the feed image with a placeholder """
-        if angle == 0:
-            # Set the initial batch so we always rotate from zero
-            batch["initial_feed"] = batch["feed"].copy()
-            return
-
-        retval = dict()
-        for img, faces, rotmat in zip(batch["initial_feed"], batch["prediction"], batch["rotmat"]):
-            if faces.any():
-                image = np.zeros_like(img)
-                matrix = rotmat
-            else:
-                image, matrix = self._rotate_image_by_angle(img, angle)
-            retval.setdefault("feed", []).append(image)
-            retval.setdefault("rotmat", []).append(matrix)
-        batch["feed"] = np.array(retval["feed"], dtype="float32")
-        batch["rotmat"] = retval["rotmat"]
+    def _get_rotation_matrices(self):
+        """ Build the rotation matrices for each angle in :attr:`rotation`.
 
-    @staticmethod
-    def _rotate_rect(bounding_box, rotation_matrix):
-        """ Rotate a bounding box dict based on the rotation_matrix"""
-        logger.trace("Rotating bounding box")
-        bounding_box = rotate_landmarks(bounding_box, rotation_matrix)
-        return bounding_box
+        All feed images are square at :attr:`~plugins.extract._base.Extractor.input_size`, so
+        the matrices only need to be calculated once for the plugin.
+
+        Returns
+        -------
+        list
+            (`angle`, `rotation matrix`) tuples for each angle in :attr:`rotation`. The rotation
+            matrix is an empty array for 0 degrees
+        """
+        retval = []
+        for angle in self.rotation:
+            if angle == 0:
+                rotation_matrix = np.array([])
+            else:
+                center = (self.input_size / 2, self.input_size / 2)
+                rotation_matrix = cv2.getRotationMatrix2D(  # pylint: disable=no-member
+                    center, -1.*angle, 1.)
+            retval.append((angle, rotation_matrix))
+        logger.debug("Rotation matrices: %s", retval)
+        return retval
 
-    def _rotate_image_by_angle(self, image, angle):
-        """ Rotate an image by a given angle.
-            From: https://stackoverflow.com/questions/22041699 """
+    def _rotate_batch(self, batch, rotation_matrix, indices):
+        """ Rotate images in a batch by given rotation matrix
 
-        logger.trace("Rotating image: (image: %s, angle: %s)", image.shape, angle)
-        channels_first = image.shape[0] <= 4
-        if channels_first:
-            image = np.moveaxis(image, 0, 2)
+        The feed is replaced with a feed containing only the rotated images at the given indices
+        of the batch. Images are rotated from the scaled frames and then passed through the
+        plugin's :func:`process_input` method.
 
-        height, width = image.shape[:2]
-        image_center = (width/2, height/2)
-        rotation_matrix = cv2.getRotationMatrix2D(  # pylint: disable=no-member
-            image_center, -1.*angle, 1.)
-        rotation_matrix[0, 2] += self.input_size / 2 - image_center[0]
-        rotation_matrix[1, 2] += self.input_size / 2 - image_center[1]
-        logger.trace("Rotated image: (rotation_matrix: %s", rotation_matrix)
-        image = cv2.warpAffine(image,  # pylint: disable=no-member
-                               rotation_matrix,
-                               (self.input_size, self.input_size))
-        if channels_first:
-            image = np.moveaxis(image, 2, 0)
+        Parameters
+        ----------
+        batch: dict
+            The batch that is currently being passed through the plugin
+        rotation_matrix: numpy.ndarray
+            The rotation matrix to rotate the images by
+        indices: list
+            The indices of the images in the batch that require rotating
 
-        return image, rotation_matrix
+        Returns
+        -------
+        dict
+            The batch with the ``feed`` updated to contain the rotated images
+        """
+        logger.trace("Rotating batch: (indices: %s, rotation_matrix: %s)",
+                     indices, rotation_matrix)
+        scaled_images = self._get_feed_buffer(len(indices))
+        for idx, feed in zip(indices, scaled_images):
+            self._compile_rotated_image(batch["resized_image"][idx], rotation_matrix, feed)
+        batch["scaled_image"] = scaled_images
+        return self.process_input(batch)
@@ -16,9 +16,9 @@ class Detect(Detector):
         self.vram_per_batch = 1
         self.batchsize = 1
 
-    def _compile_detection_image(self, input_image):
+    def _compile_detection_image(self, input_image, feed):
         """ Override compile detection image for manual. No face is actually fed into a model """
-        return input_image, 1, (0, 0)
+        return 1, (0, 0), input_image
 
     def init_model(self):
         """ No model for Manual """
@@ -57,7 +57,11 @@ class Detect(Detector):
 
     def process_input(self, batch):
         """ Compile the detection image(s) for prediction """
-        batch["feed"] = (batch["scaled_image"] - 127.5) / 127.5
+        # scaled_image is a new float32 array for each batch, so normalize it in place
+        feed = batch["scaled_image"]
+        feed -= 127.5
+        feed /= 127.5
+        batch["feed"] = feed
         return batch
 
     def predict(self, batch):
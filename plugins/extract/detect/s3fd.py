@@ -46,8 +46,13 @@ class Detect(Detector):
         return batch
 
     def predict(self, batch):
-        """ Run model to get predictions """
-        predictions = self.model.predict(batch["feed"])
+        """ Run model to get predictions
+
+        Rotated feeds only hold the images that do not yet have faces, so the feed size varies
+        between rotations. Passing the plugin's batch size allows the ``Amd`` backend to split the
+        feed into a small set of batch sizes rather than compiling kernels for every feed size.
+        """
+        predictions = self.model.predict(batch["feed"], batch_size=self.batchsize)
         batch["prediction"] = self.model.finalize_predictions(predictions)
         logger.trace("filename: %s, prediction: %s", batch["filename"], batch["prediction"])
         return batch
@@ -224,8 +229,9 @@ class S3fd(KSession):
 
     @staticmethod
     def prepare_batch(batch):
-        """ Prepare a batch for prediction """
-        batch = batch - np.array([104.0, 117.0, 123.0])
+        """ Prepare a batch for prediction. The mean is subtracted from the ``float32`` batch in
+        place """
+        batch -= np.array([104.0, 117.0, 123.0], dtype="float32")
         batch = batch.transpose(0, 3, 1, 2)
         return batch
 